@@ -1,6 +1,8 @@
 import os
+import re
 import shutil
-import glob
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # fpga/
@@ -20,29 +22,37 @@ FILES_TO_REMOVE = [
     "usage_statistics_webtalk.html"
 ]
 
+# All file patterns folded into one regex so a single directory scan suffices
+_FILE_RE = re.compile("|".join(fnmatch.translate(p) for p in FILES_TO_REMOVE))
+_DIR_SET = frozenset(DIRS_TO_REMOVE)
+
+def _remove_dir(entry):
+    try:
+        shutil.rmtree(entry.path)
+    except Exception as e:
+        print(f"    [ERROR] Could not remove {entry.name}: {e}")
+
 def clean():
     print(f"[CLEAN] Cleaning project root: {PROJECT_ROOT}")
     
-    # 1. Remove Directories
-    for d in DIRS_TO_REMOVE:
-        path = os.path.join(PROJECT_ROOT, d)
-        if os.path.exists(path):
-            print(f"  - Removing Directory: {d}")
-            try:
-                shutil.rmtree(path)
-            except Exception as e:
-                print(f"    [ERROR] Could not remove {d}: {e}")
-
-    # 2. Remove Files (Glob patterns)
-    for pattern in FILES_TO_REMOVE:
-        search_path = os.path.join(PROJECT_ROOT, pattern)
-        files = glob.glob(search_path)
-        for f in files:
-            print(f"  - Removing File: {os.path.basename(f)}")
-            try:
-                os.remove(f)
-            except Exception as e:
-                print(f"    [ERROR] Could not remove {f}: {e}")
+    # One pass over PROJECT_ROOT for both directories and files
+    dirs = []
+    with os.scandir(PROJECT_ROOT) as it:
+        for entry in it:
+            if entry.name in _DIR_SET and entry.is_dir():
+                print(f"  - Removing Directory: {entry.name}")
+                dirs.append(entry)
+            elif _FILE_RE.match(entry.name) and entry.is_file():
+                print(f"  - Removing File: {entry.name}")
+                try:
+                    os.remove(entry.path)
+                except Exception as e:
+                    print(f"    [ERROR] Could not remove {entry.path}: {e}")
+
+    # Directory trees are independent and unlink-bound; remove them concurrently
+    if dirs:
+        with ThreadPoolExecutor(max_workers=len(dirs)) as pool:
+            list(pool.map(_remove_dir, dirs))
 
     print("[CLEAN] Done.")
 
@@ -10,195 +10,315 @@ Usage:
 import os
 import argparse
 import csv
-import matplotlib.pyplot as plt
-import numpy as np
+import heapq
+import pickle
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter, itemgetter
 
 # Basys 3 Limits (XC7A35T)
 LIMITS = {'LUT': 20800, 'FF': 41600, 'BRAM': 50, 'DSP': 90, 'IO': 106, 'BUFG': 32}
 
+# Resource order used by the charts/tables, with the limits frozen to match
+RESOURCES = ('LUT', 'FF', 'BRAM', 'DSP', 'IO', 'BUFG')
+_LIMIT_VALUES = tuple(LIMITS[r] for r in RESOURCES)
+# Percent-per-unit for each limit, so the report multiplies instead of divides
+_PCT_SCALE = tuple(100.0 / v for v in _LIMIT_VALUES)
+
+# Column layout written by synth_report.tcl
+HIER_COLUMNS = ('instance', 'module', 'luts', 'ffs', 'bram', 'dsp')
+
+# One row of hierarchical_utilization.csv (tuple, no per-row dict)
+Module = namedtuple('Module', HIER_COLUMNS)
+
+# Chart raster settings: sized for embedding in markdown, not print
+CHART_DPI = 100
+DRAFT_DPI = 60  # --draft: quick-look charts, ~1/3 the pixels
+PNG_COMPRESS_LEVEL = 1  # zlib level; 1 is far faster than the default 6
+CHART_TOP_N = 8  # largest module count drawn by any chart
+
+# Fixed style for every chart, applied once per figure via rc_context
+CHART_STYLE = {
+    'axes.grid': False,
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'font.size': 9,
+    'axes.titlesize': 11,
+    'axes.labelsize': 9,
+    'figure.autolayout': False,
+    'path.simplify_threshold': 1.0,
+    'text.hinting': 'none',
+    # Single bundled font: no fallback-list lookups; SVG keeps text as text
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['DejaVu Sans'],
+    'svg.fonttype': 'none',
+}
+
+# "Key: value" lines in critical_path_summary.txt, and the ones the report uses
+_KV_LINE = re.compile(rb'([^:\n]*):[ \t]*([^\n]*)')
+CRIT_PATH_KEYS = frozenset({'slack', 'logic_levels', 'start_point', 'end_point'})
+
+# Parsed-report cache kept next to the inputs (matches the *.cache.pkl ignore)
+PARSE_CACHE = '.parse.cache.pkl'
+
+def _to_number(value):
+    """Coerce a CSV value to int/float, leaving non-numeric text as-is."""
+    try:
+        return float(value) if '.' in value else int(value)
+    except ValueError:
+        return value
+
 def parse_summary_csv(csv_path):
     """Parse synthesis_summary.csv into a dictionary."""
-    data = {}
-    if not os.path.exists(csv_path):
+    try:
+        with open(csv_path, 'r') as f:
+            rows = [line.split(',') for line in f.read().splitlines()]
+    except FileNotFoundError:
         print(f"WARNING: {csv_path} not found")
-        return data
-    with open(csv_path, 'r') as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if len(row) >= 2 and row[0] != 'metric':
-                try:
-                    data[row[0]] = float(row[1]) if '.' in row[1] else int(row[1])
-                except ValueError:
-                    data[row[0]] = row[1]
-    return data
+        return {}
+    return {row[0]: _to_number(row[1]) for row in rows
+            if len(row) >= 2 and row[0] != 'metric'}
 
 def parse_hierarchical_csv(csv_path):
-    """Parse hierarchical_utilization.csv into list of module dicts."""
+    """Parse hierarchical_utilization.csv into a list of Module tuples."""
     modules = []
-    if not os.path.exists(csv_path):
+    try:
+        f = open(csv_path, 'r', newline='')
+    except FileNotFoundError:
         print(f"WARNING: {csv_path} not found")
         return modules
-    with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
+    with f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return modules
+        # Resolve column positions once instead of probing a dict per row
+        try:
+            columns = itemgetter(*(header.index(c) for c in HIER_COLUMNS))
+        except ValueError:
+            print(f"WARNING: {csv_path} is missing expected columns")
+            return modules
         for row in reader:
             try:
-                modules.append({
-                    'instance': row.get('instance', ''),
-                    'module': row.get('module', ''),
-                    'luts': int(row.get('luts', 0)),
-                    'ffs': int(row.get('ffs', 0)),
-                    'bram': float(row.get('bram', 0)),
-                    'dsp': int(row.get('dsp', 0))
-                })
-            except (ValueError, KeyError):
+                inst, mod, luts, ffs, bram, dsp = columns(row)
+                modules.append(Module(inst, mod, int(luts), int(ffs), float(bram), int(dsp)))
+            except (ValueError, IndexError):
                 continue
     return modules
 
-def parse_critical_path(txt_path):
-    """Parse critical_path_summary.txt."""
+def parse_critical_path(txt_path, keys=CRIT_PATH_KEYS):
+    """Parse critical_path_summary.txt.
+    
+    Reading stops as soon as every name in keys has been seen; pass
+    keys=None to collect all fields.
+    """
     info = {}
-    if not os.path.exists(txt_path):
+    try:
+        f = open(txt_path, 'rb')
+    except FileNotFoundError:
         return info
-    with open(txt_path, 'r') as f:
+    with f:
         for line in f:
-            if ':' in line:
-                parts = line.strip().split(':', 1)
-                if len(parts) == 2:
-                    key = parts[0].strip().lower().replace(' ', '_')
-                    info[key] = parts[1].strip()
+            m = _KV_LINE.match(line)
+            if not m:
+                continue
+            key = m.group(1).strip().lower().replace(b' ', b'_').decode()
+            info[key] = m.group(2).strip().decode()
+            if keys is not None and keys.issubset(info):
+                break
     return info
 
-def safe_get(data, key, default=0):
-    return data.get(key, default)
-
-def pct(used, limit):
-    return f"{used/limit*100:.2f}%" if limit > 0 else "0%"
-
-def generate_charts(data, modules, output_dir):
-    """Generate all matplotlib charts."""
-    os.makedirs(output_dir, exist_ok=True)
+def _save_figure(fig, path, dpi):
+    """Save fig to path, using light zlib compression for PNG output."""
+    if path.endswith('.png'):
+        fig.savefig(path, dpi=dpi, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+    else:
+        fig.savefig(path, dpi=dpi)
+
+def _render_dashboard(data, ranked, path, dpi=CHART_DPI):
+    """Render the 2x2 build-analysis dashboard to path."""
+    # Plotting stack is imported here so the parsers stay cheap to import
+    import matplotlib
+    import numpy as np
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
     
-    # --- Chart 1: Resource Usage Comparison ---
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    fig.suptitle('FPGA Build Analysis - STM32-FPGA Bridge', fontsize=14, fontweight='bold')
+    # Bar faces are rasterized for PNG; SVG output stays fully vector
+    raster = not path.endswith('.svg')
+    with matplotlib.rc_context(CHART_STYLE):
+        # OO API on an Agg canvas: no pyplot figure manager / global state
+        fig = Figure(figsize=(10, 7))
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(2, 2)
+        fig.suptitle('FPGA Build Analysis - STM32-FPGA Bridge', fontsize=14, fontweight='bold')
+        
+        # Pull every metric out of data once; the panels below share them
+        get = data.get
+        used = np.array([get('impl_' + r.lower(), 0) for r in RESOURCES], dtype=np.float64)
+        synth = np.array([get('synth_lut', 0), get('synth_ff', 0),
+                          get('synth_bram', 0), get('synth_dsp', 0)], dtype=np.float64)
+        impl = used[:4]  # LUT, FF, BRAM, DSP lead RESOURCES
+        wns = get('impl_wns', 0)
+        whs = get('impl_whs', 0)
     
-    # Top-left: Synth vs Impl
-    ax1 = axes[0, 0]
-    metrics = ['LUTs', 'FFs', 'BRAM', 'DSP']
-    synth = [safe_get(data, 'synth_lut'), safe_get(data, 'synth_ff'),
-             safe_get(data, 'synth_bram'), safe_get(data, 'synth_dsp')]
-    impl = [safe_get(data, 'impl_lut'), safe_get(data, 'impl_ff'),
-            safe_get(data, 'impl_bram'), safe_get(data, 'impl_dsp')]
+        # Top-left: Synth vs Impl
+        ax1 = axes[0, 0]
+        metrics = ['LUTs', 'FFs', 'BRAM', 'DSP']
     
-    x = np.arange(len(metrics))
-    w = 0.35
-    ax1.bar(x - w/2, synth, w, label='Synthesis', color='#3498db')
-    ax1.bar(x + w/2, impl, w, label='Implementation', color='#2ecc71')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(metrics)
-    ax1.set_title('Resource Usage: Synthesis vs Implementation')
-    ax1.legend()
-    ax1.set_ylabel('Count')
-    for i, (s, im) in enumerate(zip(synth, impl)):
-        if im > 0:
-            ax1.text(i + w/2, im, str(int(im)), ha='center', va='bottom', fontsize=9)
+        x = np.arange(len(metrics))
+        w = 0.35
+        ax1.bar(x - w/2, synth, w, label='Synthesis', color='#3498db', rasterized=raster)
+        impl_bars = ax1.bar(x + w/2, impl, w, label='Implementation', color='#2ecc71',
+                            rasterized=raster)
+        ax1.set_xticks(x)
+        ax1.set_xticklabels(metrics)
+        ax1.set_title('Resource Usage: Synthesis vs Implementation')
+        ax1.legend()
+        ax1.set_ylabel('Count')
+        ax1.bar_label(impl_bars, labels=[str(int(im)) if im > 0 else '' for im in impl], fontsize=9)
     
-    # Top-right: Timing
-    ax2 = axes[0, 1]
-    wns = safe_get(data, 'impl_wns')
-    whs = safe_get(data, 'impl_whs')
-    timing_names = ['Setup (WNS)', 'Hold (WHS)']
-    timing_vals = [wns, whs]
-    colors = ['#27ae60' if v >= 0 else '#e74c3c' for v in timing_vals]
-    bars = ax2.bar(timing_names, timing_vals, color=colors, width=0.5)
-    ax2.axhline(0, color='k', linewidth=0.5)
-    ax2.set_title('Timing Slack (ns)')
-    ax2.set_ylabel('Slack (ns)')
-    for bar, v in zip(bars, timing_vals):
-        ax2.text(bar.get_x() + bar.get_width()/2, v + 0.1, f'{v:.2f}', 
-                ha='center', fontweight='bold')
+        # Top-right: Timing
+        ax2 = axes[0, 1]
+        timing_names = ['Setup (WNS)', 'Hold (WHS)']
+        timing_vals = np.array([wns, whs], dtype=np.float64)
+        colors = np.where(timing_vals >= 0, '#27ae60', '#e74c3c')
+        bars = ax2.bar(timing_names, timing_vals, color=colors, width=0.5, rasterized=raster)
+        ax2.axhline(0, color='k', linewidth=0.5)
+        ax2.set_title('Timing Slack (ns)')
+        ax2.set_ylabel('Slack (ns)')
+        ax2.bar_label(bars, fmt='%.2f', padding=2, fontweight='bold')
     
-    # Bottom-left: Utilization %
-    ax3 = axes[1, 0]
-    resources = ['LUT', 'FF', 'BRAM', 'DSP', 'IO', 'BUFG']
-    percentages = [
-        safe_get(data, 'impl_lut') / LIMITS['LUT'] * 100,
-        safe_get(data, 'impl_ff') / LIMITS['FF'] * 100,
-        safe_get(data, 'impl_bram') / LIMITS['BRAM'] * 100,
-        safe_get(data, 'impl_dsp') / LIMITS['DSP'] * 100,
-        safe_get(data, 'impl_io') / LIMITS['IO'] * 100,
-        safe_get(data, 'impl_bufg') / LIMITS['BUFG'] * 100,
-    ]
-    colors = ['#27ae60' if p < 50 else '#f39c12' if p < 80 else '#e74c3c' for p in percentages]
-    bars = ax3.barh(resources, percentages, color=colors)
-    ax3.set_xlim(0, 100)
-    ax3.set_xlabel('Utilization %')
-    ax3.set_title('Resource Utilization')
-    ax3.axvline(50, color='#f39c12', linestyle='--', alpha=0.5)
-    ax3.axvline(80, color='#e74c3c', linestyle='--', alpha=0.5)
-    for bar, p in zip(bars, percentages):
-        ax3.text(min(p + 2, 95), bar.get_y() + bar.get_height()/2, 
-                f'{p:.1f}%', va='center', fontsize=9)
+        # Bottom-left: Utilization %
+        ax3 = axes[1, 0]
+        resources = RESOURCES
+        limits = np.array(_LIMIT_VALUES, dtype=np.float64)
+        percentages = used / limits * 100
+        colors = np.where(percentages < 50, '#27ae60',
+                          np.where(percentages < 80, '#f39c12', '#e74c3c'))
+        bars = ax3.barh(resources, percentages, color=colors, rasterized=raster)
+        ax3.set_xlim(0, 100)
+        ax3.set_xlabel('Utilization %')
+        ax3.set_title('Resource Utilization')
+        ax3.axvline(50, color='#f39c12', linestyle='--', alpha=0.5)
+        ax3.axvline(80, color='#e74c3c', linestyle='--', alpha=0.5)
+        # Placed by hand rather than with bar_label so labels for bars at or
+        # past 100% stay inside the fixed 0-100 axis
+        for bar, p in zip(bars, percentages):
+            ax3.text(min(p + 2, 95), bar.get_y() + bar.get_height()/2,
+                     f'{p:.1f}%', va='center', fontsize=9)
     
-    # Bottom-right: Per-Module Breakdown
-    ax4 = axes[1, 1]
-    if modules:
-        # Sort by LUTs, take top 6
-        sorted_mods = sorted(modules, key=lambda m: m['luts'], reverse=True)[:6]
-        names = [m['instance'][:12] for m in sorted_mods]
-        luts = [m['luts'] for m in sorted_mods]
-        ffs = [m['ffs'] for m in sorted_mods]
+        # Bottom-right: Per-Module Breakdown
+        ax4 = axes[1, 1]
+        if ranked:
+            # Already sorted by LUTs, take top 6
+            sorted_mods = ranked[:6]
+            names = [m.instance[:12] for m in sorted_mods]
+            luts = np.array([m.luts for m in sorted_mods])
+            ffs = np.array([m.ffs for m in sorted_mods])
         
-        x = np.arange(len(names))
-        w = 0.35
-        ax4.bar(x - w/2, luts, w, label='LUTs', color='#3498db')
-        ax4.bar(x + w/2, ffs, w, label='FFs', color='#e74c3c')
-        ax4.set_xticks(x)
-        ax4.set_xticklabels(names, rotation=30, ha='right')
-        ax4.set_title('Per-Module Resource Usage')
-        ax4.legend()
-        ax4.set_ylabel('Count')
-    else:
-        ax4.text(0.5, 0.5, 'No hierarchical data', ha='center', va='center', 
-                transform=ax4.transAxes)
-        ax4.set_title('Per-Module Resource Usage')
+            x = np.arange(len(names))
+            w = 0.35
+            ax4.bar(x - w/2, luts, w, label='LUTs', color='#3498db', rasterized=raster)
+            ax4.bar(x + w/2, ffs, w, label='FFs', color='#e74c3c', rasterized=raster)
+            ax4.set_xticks(x)
+            ax4.set_xticklabels(names, rotation=30, ha='right')
+            ax4.set_title('Per-Module Resource Usage')
+            ax4.legend()
+            ax4.set_ylabel('Count')
+        else:
+            ax4.text(0.5, 0.5, 'No hierarchical data', ha='center', va='center', 
+                    transform=ax4.transAxes)
+            ax4.set_title('Per-Module Resource Usage')
     
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-    plt.savefig(os.path.join(output_dir, 'design_dashboard.png'), dpi=150)
-    plt.close()
+        # Fixed margins instead of the tight_layout constraint solve
+        fig.subplots_adjust(left=0.08, right=0.97, bottom=0.12, top=0.9,
+                            wspace=0.3, hspace=0.45)
+        _save_figure(fig, path, dpi)
+
+def _render_pie(ranked, path, dpi=CHART_DPI):
+    """Render the LUT-by-module pie chart to path (skipped if no LUTs)."""
+    import matplotlib
+    import numpy as np
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    raster = not path.endswith('.svg')
+    with matplotlib.rc_context(CHART_STYLE):
+        fig = Figure(figsize=(8, 6.4))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        sorted_mods = ranked
+        labels = [m.instance for m in sorted_mods]
+        sizes = [m.luts for m in sorted_mods]
     
-    # --- Chart 2: Module Pie Chart ---
-    if modules:
-        fig, ax = plt.subplots(figsize=(10, 8))
-        sorted_mods = sorted(modules, key=lambda m: m['luts'], reverse=True)[:8]
-        labels = [m['instance'] for m in sorted_mods]
-        sizes = [m['luts'] for m in sorted_mods]
-        
         if sum(sizes) > 0:
-            colors = plt.cm.Set3(np.linspace(0, 1, len(sizes)))
+            colors = matplotlib.colormaps['Set3'](np.linspace(0, 1, len(sizes)))
             wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%',
-                                               colors=colors, startangle=90)
+                                               colors=colors, startangle=90,
+                                               wedgeprops={'rasterized': raster})
             ax.set_title('LUT Distribution by Module', fontsize=14, fontweight='bold')
-            plt.tight_layout()
-            plt.savefig(os.path.join(output_dir, 'module_distribution.png'), dpi=150)
-        plt.close()
+            fig.subplots_adjust(left=0.05, right=0.95, bottom=0.05, top=0.9)
+            _save_figure(fig, path, dpi)
+
+def generate_charts(data, modules, output_dir, fmt='png', dpi=CHART_DPI):
+    """Generate all matplotlib charts as fmt ('png' or 'svg').
+    
+    The figures are independent and rendering is single-threaded, so
+    each one is drawn in its own worker process.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Rank once for both charts; workers only receive the rows they draw
+    ranked = heapq.nlargest(CHART_TOP_N, modules, key=attrgetter('luts'))
+    tasks = [(_render_dashboard, data, ranked,
+              os.path.join(output_dir, f'design_dashboard.{fmt}'), dpi)]
+    if ranked:
+        tasks.append((_render_pie, ranked,
+                      os.path.join(output_dir, f'module_distribution.{fmt}'), dpi))
+    
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers < 2:
+        # Not worth a process spawn and a matplotlib re-import
+        for fn, *args in tasks:
+            fn(*args)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = [pool.submit(*task) for task in tasks]
+        for job in jobs:
+            job.result()  # re-raise any worker exception
 
-def generate_markdown(data, modules, crit_path, output_file):
+def generate_markdown(data, modules, crit_path, output_file, chart_ext='png'):
     """Generate professional markdown report."""
     
-    wns = safe_get(data, 'impl_wns')
-    whs = safe_get(data, 'impl_whs')
-    freq = safe_get(data, 'max_freq')
-    power = safe_get(data, 'total_power')
+    # Resolve every metric once; the template below only reads locals
+    get = data.get
+    wns = get('impl_wns', 0)
+    whs = get('impl_whs', 0)
+    freq = get('max_freq', 0)
+    power = get('total_power', 0)
+    clock_period = get('clock_period', 10.0)
+    synth_time = int(get('synth_time', 0))
+    impl_time = int(get('impl_time', 0))
+    
+    synth_lut, impl_lut = get('synth_lut', 0), get('impl_lut', 0)
+    synth_ff, impl_ff = get('synth_ff', 0), get('impl_ff', 0)
+    synth_bram, impl_bram = get('synth_bram', 0), get('impl_bram', 0)
+    synth_dsp, impl_dsp = get('synth_dsp', 0), get('impl_dsp', 0)
+    synth_io, impl_io = get('synth_io', 0), get('impl_io', 0)
+    synth_bufg, impl_bufg = get('synth_bufg', 0), get('impl_bufg', 0)
+    
+    lim_lut, lim_ff, lim_bram, lim_dsp, lim_io, lim_bufg = _LIMIT_VALUES
+    k_lut, k_ff, k_bram, k_dsp, k_io, k_bufg = _PCT_SCALE
+    lut_pct = f"{impl_lut * k_lut:.2f}%"
     
     # Module table
-    module_rows = ""
     if modules:
-        sorted_mods = sorted(modules, key=lambda m: m['luts'], reverse=True)
-        total_luts = sum(m['luts'] for m in sorted_mods) or 1
-        for m in sorted_mods[:10]:
-            pct_total = m['luts'] / total_luts * 100
-            module_rows += f"| `{m['instance']}` | {m['module']} | {m['luts']} | {m['ffs']} | {pct_total:.1f}% |\n"
+        total_luts = sum(m.luts for m in modules) or 1
+        module_rows = "".join(
+            f"| `{m.instance}` | {m.module} | {m.luts} | {m.ffs} | {m.luts / total_luts * 100:.1f}% |\n"
+            for m in heapq.nlargest(10, modules, key=attrgetter('luts')))
     else:
         module_rows = "| *No data* | - | - | - | - |\n"
     
@@ -208,69 +328,75 @@ def generate_markdown(data, modules, crit_path, output_file):
     crit_start = crit_path.get('start_point', 'N/A')
     crit_end = crit_path.get('end_point', 'N/A')
     
-    md = f"""# FPGA Synthesis & Implementation Report
+    # Emit section by section rather than materializing one giant string
+    parts = [
+        f"""# FPGA Synthesis & Implementation Report
 
-**Project:** {safe_get(data, 'project', 'STM32-FPGA Bridge')}  
-**Device:** {safe_get(data, 'part', 'xc7a35tcpg236-1')} (Basys 3)  
-**Top Module:** {safe_get(data, 'top_module', 'top')}  
-**Clock:** {safe_get(data, 'clock_period', 10.0)} ns (100 MHz)
+**Project:** {get('project', 'STM32-FPGA Bridge')}  
+**Device:** {get('part', 'xc7a35tcpg236-1')} (Basys 3)  
+**Top Module:** {get('top_module', 'top')}  
+**Clock:** {clock_period} ns (100 MHz)
 
 ---
 
-## Executive Summary
+""",
+        f"""## Executive Summary
 
 | Metric | Value | Status |
 |--------|-------|--------|
 | **Max Frequency** | **{freq:.1f} MHz** | {'Large Headroom' if freq > 150 else 'Good Headroom' if freq > 100 else 'Marginal Headroom'} |
 | **Setup Slack (WNS)** | {wns:.3f} ns | {'PASS' if wns >= 0 else 'FAIL'} |
 | **Hold Slack (WHS)** | {whs:.3f} ns | {'PASS' if whs >= 0 else 'FAIL'} |
-| **LUT Usage** | {pct(safe_get(data, 'impl_lut'), LIMITS['LUT'])} | Good |
+| **LUT Usage** | {lut_pct} | Good |
 | **Total Power** | {power:.3f} W | estimated |
 
 ---
 
-## 1. Resource Utilization
+""",
+        f"""## 1. Resource Utilization
 
 ### 1.1 Summary
 
 | Resource | Synthesis | Implementation | Available | Utilization |
 |----------|-----------|----------------|-----------|-------------|
-| **Slice LUTs** | {int(safe_get(data, 'synth_lut'))} | {int(safe_get(data, 'impl_lut'))} | {LIMITS['LUT']:,} | {pct(safe_get(data, 'impl_lut'), LIMITS['LUT'])} |
-| **Slice Registers** | {int(safe_get(data, 'synth_ff'))} | {int(safe_get(data, 'impl_ff'))} | {LIMITS['FF']:,} | {pct(safe_get(data, 'impl_ff'), LIMITS['FF'])} |
-| **Block RAM** | {safe_get(data, 'synth_bram'):.1f} | {safe_get(data, 'impl_bram'):.1f} | {LIMITS['BRAM']} | {pct(safe_get(data, 'impl_bram'), LIMITS['BRAM'])} |
-| **DSP48E1** | {int(safe_get(data, 'synth_dsp'))} | {int(safe_get(data, 'impl_dsp'))} | {LIMITS['DSP']} | {pct(safe_get(data, 'impl_dsp'), LIMITS['DSP'])} |
-| **Bonded IOB** | {int(safe_get(data, 'synth_io'))} | {int(safe_get(data, 'impl_io'))} | {LIMITS['IO']} | {pct(safe_get(data, 'impl_io'), LIMITS['IO'])} |
-| **BUFG** | {int(safe_get(data, 'synth_bufg'))} | {int(safe_get(data, 'impl_bufg'))} | {LIMITS['BUFG']} | {pct(safe_get(data, 'impl_bufg'), LIMITS['BUFG'])} |
+| **Slice LUTs** | {int(synth_lut)} | {int(impl_lut)} | {lim_lut:,} | {lut_pct} |
+| **Slice Registers** | {int(synth_ff)} | {int(impl_ff)} | {lim_ff:,} | {impl_ff * k_ff:.2f}% |
+| **Block RAM** | {synth_bram:.1f} | {impl_bram:.1f} | {lim_bram} | {impl_bram * k_bram:.2f}% |
+| **DSP48E1** | {int(synth_dsp)} | {int(impl_dsp)} | {lim_dsp} | {impl_dsp * k_dsp:.2f}% |
+| **Bonded IOB** | {int(synth_io)} | {int(impl_io)} | {lim_io} | {impl_io * k_io:.2f}% |
+| **BUFG** | {int(synth_bufg)} | {int(impl_bufg)} | {lim_bufg} | {impl_bufg * k_bufg:.2f}% |
 
 ### 1.2 Logic Primitives
 
 | Primitive | Synthesis | Implementation | Purpose |
 |-----------|-----------|----------------|---------|
-| **LUT as Logic** | {int(safe_get(data, 'synth_lut'))} | {int(safe_get(data, 'impl_lut'))} | Combinational logic |
-| **LUT as Memory** | {int(safe_get(data, 'synth_lutram'))} | {int(safe_get(data, 'impl_lutram'))} | Distributed RAM |
-| **MUXF7** | {int(safe_get(data, 'synth_muxf7'))} | {int(safe_get(data, 'impl_muxf7'))} | Wide muxes (7-8 inputs) |
-| **MUXF8** | {int(safe_get(data, 'synth_muxf8'))} | {int(safe_get(data, 'impl_muxf8'))} | Wider muxes |
-| **CARRY4** | {int(safe_get(data, 'synth_carry'))} | {int(safe_get(data, 'impl_carry'))} | Fast carry chains |
+| **LUT as Logic** | {int(synth_lut)} | {int(impl_lut)} | Combinational logic |
+| **LUT as Memory** | {int(get('synth_lutram', 0))} | {int(get('impl_lutram', 0))} | Distributed RAM |
+| **MUXF7** | {int(get('synth_muxf7', 0))} | {int(get('impl_muxf7', 0))} | Wide muxes (7-8 inputs) |
+| **MUXF8** | {int(get('synth_muxf8', 0))} | {int(get('impl_muxf8', 0))} | Wider muxes |
+| **CARRY4** | {int(get('synth_carry', 0))} | {int(get('impl_carry', 0))} | Fast carry chains |
 
 ---
 
-## 2. Per-Module Breakdown
+""",
+        f"""## 2. Per-Module Breakdown
 
 | Instance | Module | LUTs | FFs | % of Total |
 |----------|--------|------|-----|------------|
 {module_rows}
 
-![Module Distribution](charts/module_distribution.png)
+![Module Distribution](charts/module_distribution.{chart_ext})
 
 ---
 
-## 3. Timing Analysis
+""",
+        f"""## 3. Timing Analysis
 
 ### 3.1 Summary
 
 | Metric | Value |
 |--------|-------|
-| **Clock Period** | {safe_get(data, 'clock_period', 10.0)} ns |
+| **Clock Period** | {clock_period} ns |
 | **Setup Slack (WNS)** | {wns:.3f} ns |
 | **Hold Slack (WHS)** | {whs:.3f} ns |
 | **Max Achievable Freq** | {freq:.1f} MHz |
@@ -287,76 +413,171 @@ def generate_markdown(data, modules, crit_path, output_file):
 
 ---
 
-## 4. Power Analysis
+""",
+        f"""## 4. Power Analysis
 
 | Category | Power (W) |
 |----------|-----------|
-| **Dynamic** | {safe_get(data, 'dynamic_power', 0):.3f} |
-| **Static** | {safe_get(data, 'static_power', 0):.3f} |
+| **Dynamic** | {get('dynamic_power', 0):.3f} |
+| **Static** | {get('static_power', 0):.3f} |
 | **Total** | **{power:.3f}** |
 
 ---
 
-## 5. Build Information
+""",
+        f"""## 5. Build Information
 
 | Metric | Value |
 |--------|-------|
-| **Synthesis Time** | {int(safe_get(data, 'synth_time'))} sec |
-| **Implementation Time** | {int(safe_get(data, 'impl_time'))} sec |
-| **Total Build Time** | {int(safe_get(data, 'synth_time')) + int(safe_get(data, 'impl_time'))} sec |
+| **Synthesis Time** | {synth_time} sec |
+| **Implementation Time** | {impl_time} sec |
+| **Total Build Time** | {synth_time + impl_time} sec |
 
 ---
 
-## 6. Design Quality
+""",
+        f"""## 6. Design Quality
 
 ### Strengths
 - **{(wns/10)*100:.0f}% timing margin** on critical path
-- **{100 - safe_get(data, 'impl_lut')/LIMITS['LUT']*100:.0f}% LUTs available** for Core IP expansion
+- **{100 - impl_lut * k_lut:.0f}% LUTs available** for Core IP expansion
 - **Low power** ({power*1000:.0f} mW) - suitable for embedded applications
 
 ### Resource Headroom
 
 | Future Feature | Est. LUTs | After Addition |
 |----------------|-----------|----------------|
-| DMA Engine | ~500 | {pct(safe_get(data, 'impl_lut') + 500, LIMITS['LUT'])} |
-| Packet Processor | ~300 | {pct(safe_get(data, 'impl_lut') + 800, LIMITS['LUT'])} |
-| Hardware CRC | ~100 | {pct(safe_get(data, 'impl_lut') + 900, LIMITS['LUT'])} |
+| DMA Engine | ~500 | {(impl_lut + 500) * k_lut:.2f}% |
+| Packet Processor | ~300 | {(impl_lut + 800) * k_lut:.2f}% |
+| Hardware CRC | ~100 | {(impl_lut + 900) * k_lut:.2f}% |
 
 ---
 
-![Design Dashboard](charts/design_dashboard.png)
+""",
+        f"""![Design Dashboard](charts/design_dashboard.{chart_ext})
 
 ---
 *Generated automatically from Vivado reports*
-"""
+""",
+    ]
     
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(md)
+        f.writelines(parts)
     print(f"Report saved to: {output_file}")
 
 
+def _stamp(path):
+    """Return (mtime_ns, size) for path, or None if it does not exist (one stat call)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def cache_key(inputs, outputs, options=()):
+    """Build a cache key from input stamps, this script's stamp, the output
+    paths and any render options that change the output bytes."""
+    stamps = tuple(_stamp(p) for p in (__file__, *inputs))
+    return (stamps, tuple(os.path.abspath(p) for p in outputs), tuple(options))
+
+def load_cache(cache_path):
+    """Load the previous run's cache entry, or None if absent/unreadable.
+    
+    Any failure to load (truncated file, pickle from another version of
+    this script, wrong shape) just means the cache is rebuilt.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = pickle.load(f)
+    except Exception:
+        return None
+    return cache if isinstance(cache, dict) else None
+
+def save_cache(cache_path, key, outputs):
+    """Record the key and the files produced so the next run can skip."""
+    with open(cache_path, 'wb') as f:
+        pickle.dump({'key': key, 'outputs': [p for p in outputs if os.path.exists(p)]}, f)
+
+def parse_reports(report_dir, summary_csv, hier_csv, crit_txt, use_cache=True):
+    """Parse the three report files, reusing the copy pickled in report_dir
+    when none of them (nor this script) has changed since it was written.
+    
+    Unlike the output cache this survives a change of output path, format
+    or dpi, so only rendering is redone. use_cache=False forces a fresh
+    parse (the cache is still rewritten).
+    """
+    cache_path = os.path.join(report_dir, PARSE_CACHE)
+    stamps = tuple(_stamp(p) for p in (__file__, summary_csv, hier_csv, crit_txt))
+    cache = load_cache(cache_path) if use_cache else None
+    if cache and cache.get('stamps') == stamps:
+        parsed = cache.get('parsed')
+        if isinstance(parsed, tuple) and len(parsed) == 3:
+            return parsed
+    
+    parsed = (parse_summary_csv(summary_csv),
+              parse_hierarchical_csv(hier_csv),
+              parse_critical_path(crit_txt))
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump({'stamps': stamps, 'parsed': parsed}, f)
+    except OSError:
+        pass  # read-only or missing report dir: just don't cache
+    return parsed
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate FPGA design report')
     parser.add_argument('-r', '--report-dir', default='reports', help='Vivado reports directory')
     parser.add_argument('-o', '--output', default='docs/Design_Report.md', help='Output markdown file')
+    parser.add_argument('--format', choices=['png', 'svg'], default='png',
+                        help='Chart image format; svg skips rasterization entirely')
+    parser.add_argument('--dpi', type=int, default=CHART_DPI,
+                        help=f'PNG chart resolution (default {CHART_DPI})')
+    parser.add_argument('--draft', action='store_true',
+                        help=f'Quick low-resolution charts (dpi={DRAFT_DPI}); overrides --dpi')
+    parser.add_argument('--no-charts', action='store_true',
+                        help='Only write the markdown; matplotlib/numpy are never imported')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore cached results and re-parse/re-render everything')
     args = parser.parse_args()
+    if args.draft:
+        args.dpi = DRAFT_DPI
+    
+    summary_csv = os.path.join(args.report_dir, 'synthesis_summary.csv')
+    hier_csv = os.path.join(args.report_dir, 'hierarchical_utilization.csv')
+    crit_txt = os.path.join(args.report_dir, 'critical_path_summary.txt')
+    chart_dir = os.path.join(os.path.dirname(args.output), 'charts')
+    outputs = [args.output]
+    if not args.no_charts:
+        outputs += [os.path.join(chart_dir, f'design_dashboard.{args.format}'),
+                    os.path.join(chart_dir, f'module_distribution.{args.format}')]
+    
+    # Skip parsing and rendering entirely when nothing changed since last run
+    cache_path = args.output + '.cache.pkl'
+    key = cache_key([summary_csv, hier_csv, crit_txt], outputs,
+                    (args.dpi, args.format, args.no_charts))
+    cache = None if args.no_cache else load_cache(cache_path)
+    if (cache and cache.get('key') == key
+            and all(os.path.exists(p) for p in cache.get('outputs', ()))):
+        print(f"Reports unchanged, skipping regeneration of {args.output}")
+        return
     
     # Parse all data sources
-    summary = parse_summary_csv(os.path.join(args.report_dir, 'synthesis_summary.csv'))
-    modules = parse_hierarchical_csv(os.path.join(args.report_dir, 'hierarchical_utilization.csv'))
-    crit_path = parse_critical_path(os.path.join(args.report_dir, 'critical_path_summary.txt'))
+    summary, modules, crit_path = parse_reports(args.report_dir, summary_csv, hier_csv, crit_txt,
+                                              use_cache=not args.no_cache)
     
     print(f"Parsed {len(summary)} metrics from summary")
     print(f"Parsed {len(modules)} modules from hierarchical report")
     
     # Generate charts
-    chart_dir = os.path.join(os.path.dirname(args.output), 'charts')
-    generate_charts(summary, modules, chart_dir)
-    print(f"Charts saved to: {chart_dir}/")
+    if not args.no_charts:
+        generate_charts(summary, modules, chart_dir, args.format, args.dpi)
+        print(f"Charts saved to: {chart_dir}/")
     
     # Generate markdown
-    generate_markdown(summary, modules, crit_path, args.output)
+    generate_markdown(summary, modules, crit_path, args.output, args.format)
+    save_cache(cache_path, key, outputs)
 
 
 if __name__ == '__main__':
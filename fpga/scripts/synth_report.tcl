@@ -212,11 +212,15 @@ set hier_report [report_utilization -hierarchical -return_string]
 set lines [split $hier_report "\n"]
 
 foreach line $lines {
-    # Match table rows with data
-    if {[regexp {\|\s*(\S+)\s*\|\s*(\S+)\s*\|\s*(\d+)\s*\|\s*(\d+)\s*\|\s*([\d.]+)\s*\|\s*(\d+)\s*\|} $line match inst mod luts ffs bram dsp]} {
-        if {$inst ne "Instance" && $inst ne "---" && ![string match "-*" $inst]} {
-            puts $hier_fp "$inst,$mod,$luts,$ffs,$bram,$dsp"
-        }
+    # Table rows: | inst | mod | luts | ffs | bram | dsp | ...  (split, no regex)
+    set cols [split $line "|"]
+    if {[llength $cols] < 8} { continue }
+    lassign [lmap c [lrange $cols 1 6] {string trim $c}] inst mod luts ffs bram dsp
+    if {![string is digit -strict $luts] || ![string is digit -strict $ffs] ||
+        ![string is double -strict $bram] || ![string is digit -strict $dsp]} { continue }
+    if {$inst eq "" || $mod eq "" || [string match "*\[ \t\]*" "$inst$mod"]} { continue }
+    if {$inst ne "Instance" && $inst ne "---" && ![string match "-*" $inst]} {
+        puts $hier_fp "$inst,$mod,$luts,$ffs,$bram,$dsp"
     }
 }
 close $hier_fp
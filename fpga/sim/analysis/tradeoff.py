@@ -37,12 +37,18 @@ def analyze_offload():
     plt.plot(data_size, t_total_offload, label='FPGA Offload (SPI 25MHz)', color='blue')
     
     # Find intersection
-    idx = np.argwhere(np.diff(np.sign(t_stm32 - t_total_offload))).flatten()
-    if len(idx) > 0:
-        breakeven = data_size[idx[0]]
-        plt.plot(data_size[idx[0]], t_stm32[idx[0]], 'ko')
+    # Both times are linear in data_size, so their gap is monotonic:
+    # binary-search its zero instead of scanning for a sign change
+    gap = t_stm32 - t_total_offload
+    if gap[-1] < gap[0]:
+        gap = -gap
+    pos = np.searchsorted(gap, 0.0, side='right')
+    if 0 < pos < len(gap):
+        idx = pos - 1  # last sample before the curves cross
+        breakeven = data_size[idx]
+        plt.plot(data_size[idx], t_stm32[idx], 'ko')
         plt.annotate(f'Breakeven: {int(breakeven)} Bytes', 
-                     (breakeven, t_stm32[idx[0]]), xytext=(breakeven+100, t_stm32[idx[0]]-5))
+                     (breakeven, t_stm32[idx]), xytext=(breakeven+100, t_stm32[idx]-5))
 
     plt.title('Offload Feasibility: STM32 vs Artix-7 (SPI Link)')
     plt.xlabel('Data Batch Size (Bytes)')
@@ -176,6 +176,12 @@ package tb_pkg;
         
         function void write_results(string filename);
             int fd;
+            // Same key=value pairs on one stdout line (comma-separated so
+            // no "N passed" pattern appears), so verify.py can take them
+            // from the log without reopening the file
+            $display("[TB] RESULTS test_name=%s,total=%0d,passed=%0d,failed=%0d,i2c_writes=%0d,i2c_reads=%0d,spi_xfers=%0d,duration_ns=%0d",
+                     test_name, total_tests, passed_tests, failed_tests,
+                     i2c_writes, i2c_reads, spi_xfers, end_time - start_time);
             fd = $fopen(filename, "w");
             if (fd) begin
                 $fwrite(fd, "test_name=%s\n", test_name);
@@ -23,6 +23,8 @@ class TransactionType(Enum):
 @dataclass
 class I2CTransaction:
     """I2C transaction descriptor"""
+    __slots__ = ('rw', 'slave_addr', 'reg_addr', 'data')
+    
     rw: int           # 0=write, 1=read
     slave_addr: int   # 7-bit address
     reg_addr: int     # Register address
@@ -30,18 +32,20 @@ class I2CTransaction:
     
     def to_stimulus(self) -> str:
         """Convert to stimulus file format"""
-        data_str = ','.join(f'{d:02X}' for d in self.data)
+        data_str = bytes(self.data).hex(',').upper()
         return f"I2C {self.rw} {self.slave_addr:02X} {self.reg_addr:02X} {len(self.data)} {data_str}"
 
 
 @dataclass 
 class SPITransaction:
     """SPI transaction descriptor"""
+    __slots__ = ('tx_data',)
+    
     tx_data: List[int]  # Data to transmit
     
     def to_stimulus(self) -> str:
         """Convert to stimulus file format"""
-        data_str = ','.join(f'{d:02X}' for d in self.tx_data)
+        data_str = bytes(self.tx_data).hex(',').upper()
         return f"SPI {len(self.tx_data)} {data_str}"
 
 
@@ -50,8 +54,8 @@ class RegisterMap:
     
     def __init__(self, csv_path: str = None):
         self.registers: Dict[int, dict] = {}
-        self.writable_addrs: List[int] = []
-        self.readonly_addrs: List[int] = []
+        self.writable_addrs: Tuple[int, ...] = ()
+        self.readonly_addrs: Tuple[int, ...] = ()
         
         if csv_path:
             self.load_from_csv(csv_path)
@@ -93,15 +97,23 @@ class RegisterMap:
         self._categorize_registers()
     
     def _categorize_registers(self):
-        """Categorize registers by access type"""
-        self.writable_addrs = []
-        self.readonly_addrs = []
+        """Categorize registers by access type
+        
+        Only the primary mode counts, so 'RO/W1C' is read-only. The result
+        is stored as tuples since it is never modified after loading.
+        """
+        writable = []
+        readonly = []
         
         for addr, reg in self.registers.items():
-            if 'RW' in reg['access']:
-                self.writable_addrs.append(addr)
-            elif 'RO' in reg['access']:
-                self.readonly_addrs.append(addr)
+            mode = reg['access'].partition('/')[0]
+            if mode == 'RW':
+                writable.append(addr)
+            elif mode == 'RO':
+                readonly.append(addr)
+        
+        self.writable_addrs = tuple(writable)
+        self.readonly_addrs = tuple(readonly)
 
 
 class TestGenerator:
@@ -149,10 +161,13 @@ class TestGenerator:
         """Generate stress test sequence"""
         transactions = []
         
-        for _ in range(num_iterations):
-            write_txn, read_txn = self.gen_random_write_read()
-            transactions.append(write_txn)
-            transactions.append(read_txn)
+        # Draw every address and data byte up front in two batched calls
+        addrs = random.choices(self.regmap.writable_addrs, k=num_iterations)
+        values = random.randbytes(num_iterations)
+        
+        for addr, value in zip(addrs, values):
+            transactions.append(self.gen_i2c_write(addr, [value]))
+            transactions.append(self.gen_i2c_read(addr, 1))
         
         return transactions
     
@@ -160,14 +175,21 @@ class TestGenerator:
         """Generate interleaved I2C and SPI transactions"""
         transactions = []
         
-        for i in range(num_pairs):
+        # Batch the random draws: addresses, write bytes, SPI lengths and
+        # one pool of SPI payload bytes that is sliced per transfer
+        addrs = random.choices(self.regmap.writable_addrs, k=num_pairs)
+        values = random.randbytes(num_pairs)
+        spi_lens = random.choices(range(1, 5), k=num_pairs)
+        spi_pool = random.randbytes(sum(spi_lens))
+        pos = 0
+        
+        for addr, value, spi_len in zip(addrs, values, spi_lens):
             # I2C write
-            addr = random.choice(self.regmap.writable_addrs)
-            data = [random.randint(0, 255)]
-            transactions.append(self.gen_i2c_write(addr, data))
+            transactions.append(self.gen_i2c_write(addr, [value]))
             
             # SPI transfer (marked to run concurrently)
-            spi_data = [random.randint(0, 255) for _ in range(random.randint(1, 4))]
+            spi_data = list(spi_pool[pos:pos + spi_len])
+            pos += spi_len
             transactions.append(self.gen_spi_transfer(spi_data))
             
             # I2C read-back
@@ -179,13 +201,9 @@ class TestGenerator:
         """Generate SPI loopback test sequence"""
         # First transfer: send pattern, receive 0x00
         # Subsequent: receive previous pattern
-        transactions = []
-        
-        for i in range(num_bytes):
-            pattern = (i * 17 + 0x11) & 0xFF  # Walking pattern
-            transactions.append(self.gen_spi_transfer([pattern]))
-        
-        return transactions
+        # Walking pattern (i * 17 + 0x11) & 0xFF, stepped by range() directly
+        return [SPITransaction(tx_data=[p & 0xFF])
+                for p in range(0x11, 0x11 + 17 * num_bytes, 17)]
     
     def gen_read_only_test(self) -> List:
         """Generate tests for read-only register protection"""
@@ -203,13 +221,19 @@ class TestGenerator:
     
     def write_stimulus_file(self, filepath: str, transactions: List):
         """Write transactions to stimulus file"""
-        with open(filepath, 'w') as f:
-            f.write("# I2C/SPI Stimulus File\n")
-            f.write("# Format: TYPE [PARAMS...]\n")
-            f.write(f"# Generated with seed for reproducibility\n\n")
-            
-            for txn in transactions:
-                f.write(txn.to_stimulus() + "\n")
+        lines = [
+            "# I2C/SPI Stimulus File",
+            "# Format: TYPE [PARAMS...]",
+            "# Generated with seed for reproducibility",
+            "",
+        ]
+        lines.extend(txn.to_stimulus() for txn in transactions)
+        lines.append('')  # trailing newline after the last line
+        
+        # Encode once and hand the whole file to a single binary write
+        payload = "\n".join(lines).encode('ascii')
+        with open(filepath, 'wb') as f:
+            f.write(payload)
         
         print(f"Generated {len(transactions)} transactions to {filepath}")
 
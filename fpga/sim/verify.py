@@ -9,22 +9,30 @@ Usage:
     python verify.py --test basic_write # Run specific test
     python verify.py --list             # List available tests
     python verify.py --clean            # Clean build artifacts
+    python verify.py --rebuild          # Force recompile of unchanged sources
     python verify.py --report results.json  # Specify output report
 
 Author: Auto-generated for STM32H723ZG + Artix-7 FPGA Co-processor Project
 """
 
 import argparse
+import hashlib
+import json
 import subprocess
 import sys
 import os
-import json
 import re
 import shutil
+import signal
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+# datetime, orjson and concurrent.futures are only needed for the final
+# report or --clean, so they are imported where used
+
 #==============================================================================
 # Configuration
 #==============================================================================
@@ -57,7 +65,27 @@ PKG_DIR = SIM_DIR / "pkg"
 BFM_DIR = SIM_DIR / "bfm"
 COMMON_DIR = SIM_DIR / "common"
 WORK_DIR = SIM_DIR / "work"
+RUNS_DIR = WORK_DIR / "runs"    # Per-test cwd for concurrent simulations
 SNAPSHOT_NAME = "sim_snapshot"
+SNAPSHOT_DIR = SIM_DIR / "xsim.dir" / SNAPSHOT_NAME
+BUILD_KEY_FILE = WORK_DIR / ".build_key"   # Sources stamp of the last good build
+COMPILE_FILELIST = WORK_DIR / "compile.f"  # Source list passed to xvlog -f
+CMD_TIMEOUT = 300               # Seconds before a tool invocation is killed
+TOOL_TAIL_LINES = 500           # Lines of xvlog/xelab output kept for diagnostics
+MAX_REPORT_ERRORS = 50          # Error lines carried into the JSON report
+PARSE_MEMO_MIN = 16 * 1024      # Logs longer than this are memoized by hash
+CLEAN_WORKERS = 8               # Threads used by --clean to delete artifacts
+
+# Vivado tool error marker, matched per output line while streaming
+_TOOL_ERROR_RE = re.compile(r"ERROR:")
+
+# Simulation log patterns used by ResultParser
+# Pass and fail counts share one alternation so a line is scanned once
+_PF_RE = re.compile(r"(\d+)\s+(passed|failed)", re.IGNORECASE)
+_ERROR_RE = re.compile(r"\[.*ERROR.*\].*", re.IGNORECASE)   # non-ASCII lines only
+_TIME_RE = re.compile(r"Simulation completed at (\d+)\s*ns")
+# One-line copy of test_results.txt echoed by tb_pkg write_results()
+_TB_RESULTS_TAG = "[TB] RESULTS "
 
 #==============================================================================
 # Vivado Runner Class
@@ -71,6 +99,14 @@ class VivadoRunner:
         if not self.vivado_bin:
             raise RuntimeError("Vivado not found. Please set VIVADO_PATH or add to PATH.")
         print(f"[INFO] Using Vivado: {self.vivado_bin}")
+        
+        # Resolve the child environment and tool paths once; every
+        # invocation reuses them instead of copying os.environ and
+        # searching PATH again
+        self.env = os.environ.copy()
+        self.env["PATH"] = str(self.vivado_bin) + os.pathsep + self.env.get("PATH", "")
+        self.tools = {name: shutil.which(name, path=str(self.vivado_bin)) or name
+                      for name in ("xvlog", "xelab", "xsim")}
     
     def _find_vivado(self, explicit_path: Optional[str]) -> Optional[Path]:
         """Find Vivado installation."""
@@ -100,21 +136,22 @@ class VivadoRunner:
         
         return None
     
+    def _argv(self, cmd: List[str]) -> List[str]:
+        """cmd with the tool name replaced by its resolved absolute path."""
+        return [self.tools.get(cmd[0], cmd[0]), *cmd[1:]]
+    
     def _run_cmd(self, cmd: List[str], description: str) -> Tuple[int, str, str]:
         """Run command and capture output."""
         print(f"[CMD] {' '.join(cmd)}")
         
-        env = os.environ.copy()
-        env["PATH"] = str(self.vivado_bin) + os.pathsep + env.get("PATH", "")
-        
         try:
             result = subprocess.run(
-                cmd,
+                self._argv(cmd),
                 cwd=str(SIM_DIR),
                 capture_output=True,
                 text=True,
-                env=env,
-                timeout=300  # 5 minute timeout
+                env=self.env,
+                timeout=CMD_TIMEOUT
             )
             return result.returncode, result.stdout, result.stderr
         except subprocess.TimeoutExpired:
@@ -122,6 +159,49 @@ class VivadoRunner:
         except Exception as e:
             return -1, "", str(e)
     
+    def _run_tool(self, cmd: List[str]) -> Tuple[int, bool, str]:
+        """Run a build tool, scanning its output for errors as it streams.
+        
+        stdout and stderr are merged and read line by line; only the last
+        TOOL_TAIL_LINES lines are kept, so memory stays bounded however
+        verbose the tool is. Returns (returncode, saw_error, tail).
+        """
+        print(f"[CMD] {' '.join(cmd)}")
+        
+        tail = deque(maxlen=TOOL_TAIL_LINES)
+        saw_error = False
+        try:
+            proc = subprocess.Popen(self._argv(cmd), cwd=str(SIM_DIR), stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, text=True,
+                                    errors="replace", env=self.env, **_NEW_GROUP)
+        except OSError as e:
+            return -1, True, str(e)
+        
+        # The Vivado launchers are wrapper scripts: on timeout the whole
+        # process group must go, or the real tool keeps the pipe open
+        expired = threading.Event()
+        
+        def on_timeout():
+            expired.set()
+            _kill_tree(proc)
+        
+        timer = threading.Timer(CMD_TIMEOUT, on_timeout)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                tail.append(line)
+                if not saw_error and _TOOL_ERROR_RE.search(line):
+                    saw_error = True
+            rc = proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+        
+        if expired.is_set():
+            tail.append("Command timed out\n")
+            return -1, True, "".join(tail)
+        return rc, saw_error, "".join(tail)
+    
     def compile(self, files: List[Path]) -> bool:
         """Compile SystemVerilog files."""
         print("\n" + "="*60)
@@ -131,21 +211,31 @@ class VivadoRunner:
         # Create work directory
         WORK_DIR.mkdir(exist_ok=True)
         
-        cmd = ["xvlog", "-sv", "--work", "work=" + str(WORK_DIR)]
-        cmd.extend([str(f) for f in files])
+        # Sources go through a filelist instead of argv, which keeps the
+        # command line short however many files there are. The list is
+        # only rewritten when it changes.
+        listing = "".join(f'"{f}"\n' if " " in str(f) else f"{f}\n" for f in files)
+        try:
+            current = COMPILE_FILELIST.read_text()
+        except FileNotFoundError:
+            current = None
+        if current != listing:
+            COMPILE_FILELIST.write_text(listing)
+        
+        cmd = ["xvlog", "-sv", "--work", "work=" + str(WORK_DIR),
+               "-f", str(COMPILE_FILELIST)]
         
-        rc, stdout, stderr = self._run_cmd(cmd, "Compilation")
+        rc, saw_error, tail = self._run_tool(cmd)
         
         if rc != 0:
             print(f"[ERROR] Compilation failed (rc={rc})")
-            print(stderr)
+            print(tail)
             return False
         
         # Check for errors in output
-        if "ERROR:" in stdout or "ERROR:" in stderr:
+        if saw_error:
             print("[ERROR] Compilation errors detected")
-            print(stdout)
-            print(stderr)
+            print(tail)
             return False
         
         print("[OK] Compilation successful")
@@ -165,17 +255,16 @@ class VivadoRunner:
             "-s", SNAPSHOT_NAME
         ]
         
-        rc, stdout, stderr = self._run_cmd(cmd, "Elaboration")
+        rc, saw_error, tail = self._run_tool(cmd)
         
         if rc != 0:
             print(f"[ERROR] Elaboration failed (rc={rc})")
-            print(stderr)
+            print(tail)
             return False
         
-        if "ERROR:" in stdout or "ERROR:" in stderr:
+        if saw_error:
             print("[ERROR] Elaboration errors detected")
-            print(stdout)
-            print(stderr)
+            print(tail)
             return False
         
         print("[OK] Elaboration successful")
@@ -187,23 +276,124 @@ class VivadoRunner:
         print(f"  SIMULATION: {test_name}")
         print("="*60)
         
-        cmd = [
+        cmd = self._sim_cmd(test_name)
+        rc, stdout, stderr = self._run_cmd(cmd, f"Simulation ({test_name})")
+        
+        # Combine output
+        output = stdout + "\n" + stderr
+        
+        return self._sim_ok(rc, output, test_name), output
+    
+    def _sim_cmd(self, test_name: str) -> List[str]:
+        """xsim command line for one test against the elaborated snapshot."""
+        return [
             "xsim",
             SNAPSHOT_NAME,
             "-tclbatch", str(SIM_DIR / "xsim_cfg.tcl"),
             f"--testplusarg", f"TEST={test_name}"
         ]
+    
+    def _sim_ok(self, rc: int, output: str, test_name: str) -> bool:
+        """Judge an xsim exit: non-zero rc is fine if the run reached the end."""
+        if rc != 0 and "Simulation completed" not in output:
+            print(f"[ERROR] Simulation failed (rc={rc}): {test_name}")
+            return False
+        return True
+    
+    def _prepare_run_dir(self, test_name: str) -> Path:
+        """Create a private working directory for one simulation.
         
-        rc, stdout, stderr = self._run_cmd(cmd, f"Simulation ({test_name})")
+        The testbench writes test_results.txt and scoreboard_log.txt into
+        its cwd, so concurrent runs need separate directories. The
+        elaborated snapshot is shared through an xsim.dir symlink.
+        """
+        run_dir = RUNS_DIR / test_name
+        run_dir.mkdir(parents=True, exist_ok=True)
+        link = run_dir / "xsim.dir"
+        if not link.exists():
+            link.symlink_to(SIM_DIR / "xsim.dir", target_is_directory=True)
+        # Run directories are reused; clear the previous run's outputs so a
+        # crashed simulation is never credited with old results
+        for stale in ("test_results.txt", "xsim_stdout.log"):
+            (run_dir / stale).unlink(missing_ok=True)
+        return run_dir
+    
+    def simulate_many(self, test_names: List[str],
+                      max_parallel: Optional[int] = None) -> Dict[str, Tuple[bool, str, Path]]:
+        """Run several simulations concurrently against the shared snapshot.
+        
+        Up to max_parallel (default: CPU count) xsim processes run at once,
+        each in its own run directory with output going to xsim_stdout.log
+        there. Returns {test_name: (success, output, run_dir)}. Falls back
+        to serial simulate() calls if run directories cannot be set up
+        (e.g. no symlink permission on Windows).
+        """
+        print("\n" + "="*60)
+        print(f"  SIMULATION: {', '.join(test_names)}")
+        print("="*60)
         
-        # Combine output
-        output = stdout + "\n" + stderr
+        test_names = list(dict.fromkeys(test_names))  # one run per directory
+        try:
+            run_dirs = {t: self._prepare_run_dir(t) for t in test_names}
+        except OSError as e:
+            print(f"[WARN] Cannot set up per-test run directories ({e}); running serially")
+            return {t: (*self.simulate(t), SIM_DIR) for t in test_names}
         
-        if rc != 0 and "Simulation completed" not in output:
-            print(f"[ERROR] Simulation failed (rc={rc})")
-            return False, output
+        max_parallel = max(1, max_parallel or os.cpu_count() or 1)
+        pending = deque(test_names)
+        running = {}  # test_name -> (Popen, log file, start time)
+        results = {}
         
-        return True, output
+        try:
+            while pending or running:
+                # Keep the pool full
+                while pending and len(running) < max_parallel:
+                    test_name = pending.popleft()
+                    cmd = self._sim_cmd(test_name)
+                    print(f"[CMD] {' '.join(cmd)}  (in {run_dirs[test_name]})")
+                    # tb_pkg prints UTF-8 box drawing; decode it the same way on
+                    # every platform rather than with the locale codec
+                    log = open(run_dirs[test_name] / "xsim_stdout.log", "w+",
+                               encoding="utf-8", errors="replace")
+                    try:
+                        proc = subprocess.Popen(self._argv(cmd), cwd=str(run_dirs[test_name]),
+                                                stdout=log, stderr=subprocess.STDOUT,
+                                                text=True, env=self.env, **_NEW_GROUP)
+                    except OSError as e:
+                        log.close()
+                        results[test_name] = (False, str(e), run_dirs[test_name])
+                        continue
+                    running[test_name] = (proc, log, time.monotonic())
+                
+                # Reap whatever has finished (or overrun its timeout)
+                for test_name, (proc, log, started) in list(running.items()):
+                    rc = proc.poll()
+                    if rc is None:
+                        if time.monotonic() - started < CMD_TIMEOUT:
+                            continue
+                        _kill_tree(proc)  # xsim is a wrapper; take its children too
+                        proc.wait()
+                        rc = -1
+                        log.write("\nCommand timed out")
+                    log.seek(0)
+                    output = log.read()
+                    log.close()
+                    del running[test_name]
+                    results[test_name] = (self._sim_ok(rc, output, test_name), output,
+                                          run_dirs[test_name])
+                
+                if running:
+                    time.sleep(0.1)
+        finally:
+            # Only non-empty if something raised (including Ctrl-C): the
+            # children are in their own process groups and would not see
+            # the interrupt, so stop them here
+            for proc, log, _ in running.values():
+                _kill_tree(proc)
+                proc.wait()
+                log.close()
+        
+        return results
 
 #==============================================================================
 # Result Parser
@@ -217,11 +407,38 @@ class ResultParser:
         self.fail_count = 0
         self.errors = []
         self.test_results = {}
+        self._scan_memo: Dict[bytes, Dict] = {}
     
     def parse_output(self, output: str, test_name: str) -> Dict:
         """Parse simulation stdout for results."""
+        # Large logs are memoized by content hash: an identical rerun
+        # (e.g. the same test requested twice) skips the scan entirely
+        if len(output) > PARSE_MEMO_MIN:
+            key = hashlib.blake2b(output.encode(), digest_size=16).digest()
+            scanned = self._scan_memo.get(key)
+            if scanned is None:
+                scanned = self._scan_memo[key] = self._scan_output(output)
+        else:
+            scanned = self._scan_output(output)
+        
+        # Fresh containers per call so callers never share memoized state
+        result = {"test": test_name, **scanned, "errors": list(scanned["errors"])}
+        if "file_results" in scanned:
+            result["file_results"] = dict(scanned["file_results"])
+        
+        self.test_results[test_name] = result
+        self.pass_count += result["pass_count"]
+        self.fail_count += result["fail_count"]
+        # Keep only the first MAX_REPORT_ERRORS across all tests
+        room = MAX_REPORT_ERRORS - len(self.errors)
+        if room > 0:
+            self.errors.extend(result["errors"][:room])
+        
+        return result
+    
+    def _scan_output(self, output: str) -> Dict:
+        """Extract counts, errors and status from one simulation log."""
         result = {
-            "test": test_name,
             "passed": False,
             "pass_count": 0,
             "fail_count": 0,
@@ -229,54 +446,84 @@ class ResultParser:
             "duration_ns": 0
         }
         
-        # Look for pass/fail counts
-        pass_match = re.search(r"(\d+)\s+passed", output, re.IGNORECASE)
-        fail_match = re.search(r"(\d+)\s+failed", output, re.IGNORECASE)
-        
-        if pass_match:
-            result["pass_count"] = int(pass_match.group(1))
-        if fail_match:
-            result["fail_count"] = int(fail_match.group(1))
-        
-        # Look for errors
-        error_lines = re.findall(r"\[.*ERROR.*\].*", output, re.IGNORECASE)
-        result["errors"] = error_lines
+        # Single pass over the log: cheap substring tests pick out the few
+        # lines worth a closer look; the first pass/fail count and time win
+        pass_count = fail_count = None
+        time_match = None
+        all_passed_seen = test_passed_seen = False
+        error_lines = result["errors"]
+        
+        for line in output.splitlines():
+            if line.startswith(_TB_RESULTS_TAG):
+                # Same fields as test_results.txt; saves reading the file
+                fields = {}
+                for pair in line[len(_TB_RESULTS_TAG):].split(","):
+                    key, sep, val = pair.partition("=")
+                    if sep:
+                        fields[key.strip()] = val.strip()
+                result["file_results"] = fields
+                continue
+            low = line.lower()
+            if ((pass_count is None and "passed" in low)
+                    or (fail_count is None and "failed" in low)):
+                for m in _PF_RE.finditer(line):
+                    if m.group(2)[0] in "pP":
+                        if pass_count is None:
+                            pass_count = int(m.group(1))
+                    elif fail_count is None:
+                        fail_count = int(m.group(1))
+            if "error" in low:
+                # "[...ERROR...]" tag, case-insensitive; keep the line from
+                # its first '[' on. ASCII lines use plain finds on the
+                # lowercased copy; elsewhere lower() can change the length
+                # (e.g. 'İ'), so offsets would not line up with line
+                if line.isascii():
+                    start = low.find("[")
+                    if start >= 0:
+                        tag = low.find("error", start + 1)
+                        if tag >= 0 and low.find("]", tag + 5) >= 0:
+                            error_lines.append(line[start:])
+                else:
+                    m = _ERROR_RE.search(line)
+                    if m:
+                        error_lines.append(m.group(0))
+            if "PASSED" in line:
+                all_passed_seen = all_passed_seen or "ALL TESTS PASSED" in line
+                test_passed_seen = test_passed_seen or "TEST PASSED" in line
+            if time_match is None and "Simulation completed" in line:
+                time_match = _TIME_RE.search(line)
+        
+        if pass_count is not None:
+            result["pass_count"] = pass_count
+        if fail_count is not None:
+            result["fail_count"] = fail_count
         
         # Check for overall pass
-        if "ALL TESTS PASSED" in output or (result["fail_count"] == 0 and result["pass_count"] > 0):
+        if all_passed_seen or (result["fail_count"] == 0 and result["pass_count"] > 0):
             result["passed"] = True
-        elif "TEST PASSED" in output and result["fail_count"] == 0:
+        elif test_passed_seen and result["fail_count"] == 0:
             result["passed"] = True
         
         # Extract simulation time
-        time_match = re.search(r"Simulation completed at (\d+)\s*ns", output)
         if time_match:
             result["duration_ns"] = int(time_match.group(1))
         
-        self.test_results[test_name] = result
-        self.pass_count += result["pass_count"]
-        self.fail_count += result["fail_count"]
-        self.errors.extend(result["errors"])
-        
         return result
     
     def parse_results_file(self, filepath: Path) -> Optional[Dict]:
         """Parse test_results.txt generated by testbench."""
-        if not filepath.exists():
-            return None
-        
         try:
-            with open(filepath, "r") as f:
-                content = f.read()
-            
-            # Format: PASS_COUNT=N FAIL_COUNT=M
+            # Format: one key=value per line, read as the file streams
             result = {}
-            for line in content.strip().split("\n"):
-                if "=" in line:
-                    key, val = line.split("=", 1)
-                    result[key.strip()] = val.strip()
+            with open(filepath, "r") as f:
+                for line in f:
+                    key, sep, val = line.partition("=")
+                    if sep:
+                        result[key.strip()] = val.strip()
             
             return result
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"[WARN] Could not parse results file: {e}")
             return None
@@ -288,15 +535,39 @@ class ResultParser:
 class TestRunner:
     """Orchestrates test execution."""
     
-    def __init__(self, vivado_runner: VivadoRunner):
+    def __init__(self, vivado_runner: VivadoRunner, results_log: Optional[Path] = None):
         self.vivado = vivado_runner
         self.parser = ResultParser()
         self.results = {}
-        self.start_time = None
-        self.end_time = None
+        # Summary columns kept alongside results, one slot per test in run
+        # order, so totals are plain sums instead of dict walks
+        self._names: List[str] = []
+        self._passed: List[bool] = []
+        self._pass_counts: List[int] = []
+        self._fail_counts: List[int] = []
+        self._slot: Dict[str, int] = {}
+        self.results_log = results_log  # JSON Lines, one record per finished test
+        self.start_time: Optional[float] = None  # time.monotonic() stamps
+        self.end_time: Optional[float] = None
+        self._source_files: Optional[List[Path]] = None
     
     def get_source_files(self) -> List[Path]:
-        """Get all source files in compilation order."""
+        """Get all source files in compilation order.
+        
+        Every candidate directory is listed once with os.scandir and
+        presence is a dict lookup, instead of an exists() call per
+        candidate path. The list is computed once per runner.
+        """
+        if self._source_files is not None:
+            return self._source_files
+        
+        listings: Dict[Path, Dict[str, Path]] = {}
+        
+        def present(d: Path) -> Dict[str, Path]:
+            if d not in listings:
+                listings[d] = _list_files(d)
+            return listings[d]
+        
         files = []
         
         # Package first (defines types used by others)
@@ -311,12 +582,12 @@ class TestRunner:
             "seven_seg.sv",
             "top.sv"
         ]
-        for f in rtl_files:
-            # Check both RTL_DIR and subdirectories
-            for p in [RTL_DIR / f, RTL_DIR / "bus" / f, RTL_DIR / "core" / f, RTL_DIR / "io" / f]:
-                if p.exists():
-                    files.append(p)
-                    break
+        # Check both RTL_DIR and subdirectories; the first hit wins
+        rtl_index: Dict[str, Path] = {}
+        for d in (RTL_DIR, RTL_DIR / "bus", RTL_DIR / "core", RTL_DIR / "io"):
+            for name, path in present(d).items():
+                rtl_index.setdefault(name, path)
+        files.extend(rtl_index[f] for f in rtl_files if f in rtl_index)
         
         # BFMs
         files.append(BFM_DIR / "i2c_master_bfm.sv")
@@ -333,20 +604,22 @@ class TestRunner:
             SIM_DIR / "tests" / "integration_tests"
         ]
         for test_dir in test_dirs:
-            if test_dir.exists():
-                for f in test_dir.glob("*.sv"):
-                    files.append(f)
+            files.extend(path for name, path in present(test_dir).items()
+                         if name.endswith(".sv") and not name.startswith("."))
         
         # Top testbench last
         files.append(SIM_DIR / "tb_top.sv")
         
         # Filter to existing files
-        existing = [f for f in files if f.exists()]
-        missing = [f for f in files if not f.exists()]
+        existing = []
+        missing = []
+        for f in files:
+            (existing if f.name in present(f.parent) else missing).append(f)
         
         if missing:
             print(f"[WARN] Missing files: {[str(f) for f in missing]}")
         
+        self._source_files = existing
         return existing
     
     def run_test(self, test_name: str) -> bool:
@@ -356,72 +629,161 @@ class TestRunner:
         print(f"{'='*60}")
         
         success, output = self.vivado.simulate(test_name)
+        return self._record_result(test_name, output, SIM_DIR)
+    
+    def _record_result(self, test_name: str, output: str, run_dir: Path) -> bool:
+        """Parse one finished simulation (log + run_dir/test_results.txt)."""
         result = self.parser.parse_output(output, test_name)
         
-        # Check results file
-        results_file = SIM_DIR / "test_results.txt"
-        file_results = self.parser.parse_results_file(results_file)
-        if file_results:
-            result["file_results"] = file_results
+        # Results normally arrive in the log; fall back to the file
+        # written by older testbench builds
+        if "file_results" not in result:
+            results_file = run_dir / "test_results.txt"
+            file_results = self.parser.parse_results_file(results_file)
+            if file_results:
+                result["file_results"] = file_results
         
         self.results[test_name] = result
+        self._store_summary(test_name, result)
+        
+        # Append the record as soon as the test finishes so partial runs
+        # (timeouts, Ctrl-C) still leave per-test results behind
+        if self.results_log:
+            with open(self.results_log, "a") as f:
+                f.write(json.dumps(result) + "\n")
         
         status = "PASSED" if result["passed"] else "FAILED"
         print(f"\n[{status}] Test '{test_name}': {result['pass_count']} passed, {result['fail_count']} failed")
         
         return result["passed"]
     
-    def run_all_tests(self, test_names: Optional[List[str]] = None) -> bool:
-        """Run all specified tests (or all tests if none specified)."""
-        self.start_time = datetime.now()
+    @staticmethod
+    def _build_key(files: List[Path]) -> str:
+        """SHA-256 over each source's path, mtime and size."""
+        h = hashlib.sha256()
+        for f in files:
+            try:
+                st = f.stat()
+            except OSError:
+                h.update(f"{f}:missing\n".encode())
+                continue
+            h.update(f"{f}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+        return h.hexdigest()
+    
+    def build(self, files: List[Path], rebuild: bool = False) -> bool:
+        """Compile and elaborate, unless the snapshot is already current.
+        
+        The key of the last successful build is kept in BUILD_KEY_FILE;
+        when it matches the sources and the snapshot still exists, xvlog
+        and xelab are skipped.
+        """
+        key = self._build_key(files)
+        if not rebuild and SNAPSHOT_DIR.is_dir():
+            try:
+                if BUILD_KEY_FILE.read_text() == key:
+                    print("[INFO] Sources unchanged, reusing compiled snapshot")
+                    return True
+            except FileNotFoundError:
+                pass
+        
+        # Drop the old key first so a failed build is never reused
+        BUILD_KEY_FILE.unlink(missing_ok=True)
+        if not self.vivado.compile(files):
+            return False
+        if not self.vivado.elaborate():
+            return False
+        BUILD_KEY_FILE.write_text(key)
+        return True
+    
+    def run_all_tests(self, test_names: Optional[List[str]] = None,
+                      jobs: Optional[int] = None, rebuild: bool = False) -> bool:
+        """Run all specified tests (or all tests if none specified).
+        
+        Up to jobs simulations (default: CPU count) run at once; jobs=1
+        keeps the serial, in-place behaviour. rebuild forces compile and
+        elaborate even when the sources are unchanged.
+        """
+        self.start_time = time.monotonic()
+        if self.results_log:
+            self.results_log.write_text("")  # fresh log for this run
         
         if test_names is None or "all" in test_names:
             test_names = [t for t in TESTS.keys() if t != "all"]
         
-        # Compile and elaborate once
+        # Compile and elaborate once (skipped if nothing changed)
         files = self.get_source_files()
         print(f"\n[INFO] Found {len(files)} source files")
         
-        if not self.vivado.compile(files):
-            return False
-        
-        if not self.vivado.elaborate():
+        if not self.build(files, rebuild):
             return False
         
         # Run each test
-        all_passed = True
+        known = []
         for test_name in test_names:
             if test_name not in TESTS:
                 print(f"[WARN] Unknown test: {test_name}")
                 continue
-            
-            if not self.run_test(test_name):
-                all_passed = False
+            known.append(test_name)
         
-        self.end_time = datetime.now()
+        all_passed = True
+        if jobs == 1 or len(known) < 2:
+            for test_name in known:
+                if not self.run_test(test_name):
+                    all_passed = False
+        else:
+            # Simulations are independent xsim processes sharing one snapshot.
+            # Each test owns one run directory, so a repeated name runs once
+            known = list(dict.fromkeys(known))
+            sims = self.vivado.simulate_many(known, jobs)
+            for test_name in known:
+                success, output, run_dir = sims[test_name]
+                if not self._record_result(test_name, output, run_dir):
+                    all_passed = False
+        
+        self.end_time = time.monotonic()
         return all_passed
     
+    def _store_summary(self, test_name: str, result: Dict):
+        """Record result in the summary columns (a rerun replaces its slot)."""
+        row = (result["passed"], result["pass_count"], result["fail_count"])
+        i = self._slot.get(test_name)
+        if i is None:
+            self._slot[test_name] = len(self._names)
+            self._names.append(test_name)
+            self._passed.append(row[0])
+            self._pass_counts.append(row[1])
+            self._fail_counts.append(row[2])
+        else:
+            self._passed[i], self._pass_counts[i], self._fail_counts[i] = row
+    
     def generate_report(self, output_file: Optional[Path] = None) -> Dict:
         """Generate JSON report."""
+        from datetime import datetime
+        
         report = {
             "timestamp": datetime.now().isoformat(),
-            "duration_seconds": (self.end_time - self.start_time).total_seconds() if self.end_time else 0,
+            "duration_seconds": self.end_time - self.start_time if self.end_time is not None else 0,
             "summary": {
-                "total_tests": len(self.results),
-                "passed": sum(1 for r in self.results.values() if r["passed"]),
-                "failed": sum(1 for r in self.results.values() if not r["passed"]),
+                "total_tests": len(self._names),
+                "passed": sum(self._passed),
+                "failed": len(self._passed) - sum(self._passed),
                 "total_pass_count": self.parser.pass_count,
                 "total_fail_count": self.parser.fail_count,
             },
             "tests": self.results,
-            "errors": self.parser.errors[:50],  # Limit to 50 errors
+            "errors": self.parser.errors,  # Capped at MAX_REPORT_ERRORS
         }
         
         report["summary"]["all_passed"] = report["summary"]["failed"] == 0
         
         if output_file:
-            with open(output_file, "w") as f:
-                json.dump(report, f, indent=2)
+            try:
+                import orjson  # Optional: C-accelerated JSON for the report
+                payload = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+            except ImportError:
+                payload = json.dumps(report, indent=2).encode()
+            with open(output_file, "wb") as f:
+                f.write(payload)
             print(f"\n[INFO] Report written to: {output_file}")
         
         return report
@@ -432,13 +794,14 @@ class TestRunner:
         print("  VERIFICATION SUMMARY")
         print("="*60)
         
-        for test_name, result in self.results.items():
-            status = "✓ PASS" if result["passed"] else "✗ FAIL"
-            print(f"  {status}  {test_name}: {result['pass_count']} passed, {result['fail_count']} failed")
+        for test_name, ok, n_pass, n_fail in zip(self._names, self._passed,
+                                                 self._pass_counts, self._fail_counts):
+            status = "✓ PASS" if ok else "✗ FAIL"
+            print(f"  {status}  {test_name}: {n_pass} passed, {n_fail} failed")
         
         print("-"*60)
-        total = len(self.results)
-        passed = sum(1 for r in self.results.values() if r["passed"])
+        total = len(self._names)
+        passed = sum(self._passed)
         failed = total - passed
         
         if failed == 0:
@@ -452,8 +815,34 @@ class TestRunner:
 # Utility Functions
 #==============================================================================
 
+# Popen options that put a child in its own process group, so _kill_tree
+# can take down anything a wrapper script spawned
+_NEW_GROUP = ({"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+              if os.name == "nt" else {"start_new_session": True})
+
+def _kill_tree(proc: subprocess.Popen):
+    """Kill proc and its descendants (proc must be started with _NEW_GROUP)."""
+    try:
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                           capture_output=True)
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except OSError:
+        proc.kill()
+
+def _list_files(directory: Path) -> Dict[str, Path]:
+    """Map file name -> path for the regular files in directory ({} if absent)."""
+    try:
+        with os.scandir(directory) as it:
+            return {e.name: Path(e.path) for e in it if e.is_file()}
+    except OSError:
+        return {}
+
 def clean_build():
     """Remove build artifacts."""
+    from concurrent.futures import ThreadPoolExecutor
+    
     print("[INFO] Cleaning build artifacts...")
     
     patterns = [
@@ -468,21 +857,42 @@ def clean_build():
         SIM_DIR / "scoreboard_log.txt",
     ]
     
+    # Resolve every target first, then remove them on a thread pool: the
+    # work is unlink/rmdir syscalls over thousands of small xsim files,
+    # which release the GIL and overlap well
+    dirs, files = [], []
     for pattern in patterns:
-        if isinstance(pattern, Path):
-            if pattern.is_dir():
-                shutil.rmtree(pattern, ignore_errors=True)
-                print(f"  Removed directory: {pattern}")
-            elif "*" in str(pattern):
-                for f in SIM_DIR.glob(pattern.name):
-                    f.unlink()
-                    print(f"  Removed file: {f}")
-            elif pattern.exists():
-                pattern.unlink()
-                print(f"  Removed file: {pattern}")
+        if "*" in pattern.name:
+            files.extend(f for f in SIM_DIR.glob(pattern.name) if f.is_file())
+        elif pattern.is_dir():
+            dirs.append(pattern)
+        elif pattern.exists():
+            files.append(pattern)
+    
+    def remove(path: Path) -> Path:
+        if path in dirs:
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+        return path
+    
+    with ThreadPoolExecutor(max_workers=CLEAN_WORKERS) as pool:
+        for path in pool.map(remove, dirs + files):
+            kind = "directory" if path in dirs else "file"
+            print(f"  Removed {kind}: {path}")
     
     print("[OK] Clean complete")
 
+def _positive_int(text: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return value
+
 def list_tests():
     """Print available tests."""
     print("\nAvailable Tests:")
@@ -536,6 +946,17 @@ Examples:
         type=str,
         help="Path to Vivado bin directory"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=_positive_int,
+        default=None,
+        help="Simulations to run in parallel (default: CPU count; 1 = serial)"
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Recompile and re-elaborate even if sources are unchanged"
+    )
     
     args = parser.parse_args()
     
@@ -559,10 +980,10 @@ Examples:
         print("  3. Add Vivado bin directory to PATH")
         return 1
     
-    runner = TestRunner(vivado)
+    runner = TestRunner(vivado, args.report.with_suffix(".jsonl"))
     
     test_names = args.tests if args.tests else ["all"]
-    all_passed = runner.run_all_tests(test_names)
+    all_passed = runner.run_all_tests(test_names, args.jobs, args.rebuild)
     
     runner.print_summary()
     runner.generate_report(args.report)